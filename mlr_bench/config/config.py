@@ -68,6 +68,28 @@ class Config(BaseModel):
         default=int(os.getenv("TIMEOUT", "3600")),
         description="Execution timeout in seconds"
     )
+    max_concurrent_executions: int = Field(
+        default=int(os.getenv("MAX_CONCURRENT_EXECUTIONS", "4")),
+        ge=1,
+        description="Maximum simultaneous code executions in the python executor"
+    )
+    executor_worker_pool: bool = Field(
+        default=os.getenv("EXECUTOR_WORKER_POOL", "TRUE").upper() == "TRUE",
+        description="Run code in pre-forked warm Python workers"
+    )
+    executor_preload_modules: str = Field(
+        default=os.getenv("EXECUTOR_PRELOAD_MODULES", ""),
+        description="Comma-separated modules preloaded by every warm worker"
+    )
+    executor_worker_max_runs: int = Field(
+        default=int(os.getenv("EXECUTOR_WORKER_MAX_RUNS", "50")),
+        ge=1,
+        description="Executions before a warm worker is recycled"
+    )
+    executor_worker_max_memory_mb: int = Field(
+        default=int(os.getenv("EXECUTOR_WORKER_MAX_MEMORY_MB", "1024")),
+        description="Memory growth (MB) after which a warm worker is recycled"
+    )
     
     class Config:
         validate_assignment = True
@@ -1,9 +1,20 @@
 """MCP Client for connecting to external tools."""
 
+import os
+import sys
 import asyncio
+import tempfile
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 from loguru import logger
 
+from mlr_bench.mcp.subprocess_runner import run_subprocess
+from mlr_bench.mcp.worker_pool import PythonWorkerPool
+
+
+# Default cap on simultaneous code executions / installs
+DEFAULT_MAX_CONCURRENT_EXECUTIONS = 4
+
 
 class MCPClient:
     """Client for Model Context Protocol (MCP) servers."""
@@ -11,6 +22,9 @@ class MCPClient:
     def __init__(self):
         """Initialize MCP client."""
         self.connected_servers = {}
+        self._execution_semaphore: Optional[asyncio.Semaphore] = None
+        self._execution_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker_pool: Optional[PythonWorkerPool] = None
         logger.info("MCP Client initialized")
     
     async def connect_server(self, server_name: str, server_config: Dict[str, Any]):
@@ -38,6 +52,9 @@ class MCPClient:
         """
         if server_name in self.connected_servers:
             del self.connected_servers[server_name]
+            if server_name == "python_executor" and self._worker_pool:
+                await self._worker_pool.shutdown()
+                self._worker_pool = None
             logger.info(f"Disconnected from {server_name}")
     
     async def list_tools(self, server_name: str) -> List[str]:
@@ -157,6 +174,70 @@ class MCPClient:
             "error": f"Unknown tool: {tool_name}"
         }
     
+    def _executor_config(self) -> Dict[str, Any]:
+        """Get the python_executor server configuration.
+        
+        Returns:
+            Server configuration (empty if not connected)
+        """
+        server = self.connected_servers.get("python_executor", {})
+        return server.get("config", {})
+    
+    def _get_execution_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore limiting simultaneous executions.
+        
+        The limit is read from the ``max_concurrency`` key of the
+        python_executor server configuration.
+        
+        Returns:
+            Execution semaphore
+        """
+        loop = asyncio.get_running_loop()
+        if self._execution_semaphore is None or self._execution_loop is not loop:
+            limit = self._executor_config().get(
+                "max_concurrency", DEFAULT_MAX_CONCURRENT_EXECUTIONS
+            )
+            self._execution_semaphore = asyncio.Semaphore(max(1, int(limit)))
+            self._execution_loop = loop
+        return self._execution_semaphore
+    
+    def _get_worker_pool(self) -> Optional[PythonWorkerPool]:
+        """Get the warm worker pool, if enabled.
+        
+        The pool belongs to the event loop that created it; a pool left
+        behind by a finished loop is killed and replaced.
+        
+        Returns:
+            Worker pool, or None when ``worker_pool`` is disabled
+        """
+        config = self._executor_config()
+        if not config.get("worker_pool", False):
+            return None
+        
+        loop = asyncio.get_running_loop()
+        if self._worker_pool is not None and self._worker_pool.loop not in (None, loop):
+            self._worker_pool.abandon()
+            self._worker_pool = None
+        
+        if self._worker_pool is None:
+            self._worker_pool = PythonWorkerPool(
+                size=config.get("max_concurrency", DEFAULT_MAX_CONCURRENT_EXECUTIONS),
+                preload_modules=config.get("preload_modules", []),
+                max_runs_per_worker=config.get("worker_max_runs", 50),
+                max_memory_growth_mb=config.get("worker_max_memory_mb", 1024)
+            )
+        return self._worker_pool
+    
+    @staticmethod
+    def _log_output(stream_name: str, text: str) -> None:
+        """Log executor output as it is produced.
+        
+        Args:
+            stream_name: "stdout" or "stderr"
+            text: Output chunk
+        """
+        logger.debug(f"[python_executor:{stream_name}] {text.rstrip()}")
+    
     async def _call_python_executor(
         self, 
         tool_name: str, 
@@ -174,31 +255,43 @@ class MCPClient:
         if tool_name == "execute_code":
             code = arguments.get("code", "")
             timeout = arguments.get("timeout", 30)
+            workspace = arguments.get("workspace")
+            cwd = Path(workspace) if workspace else None
             
             try:
-                # Create temporary file
-                import tempfile
-                import subprocess
-                
-                with tempfile.NamedTemporaryFile(
-                    mode='w', 
-                    suffix='.py', 
-                    delete=False
-                ) as f:
-                    f.write(code)
-                    temp_file = f.name
+                pool = self._get_worker_pool()
                 
-                # Execute code
-                result = subprocess.run(
-                    ["python3", temp_file],
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout
-                )
+                if pool is not None:
+                    async with self._get_execution_semaphore():
+                        result = await pool.execute(code, timeout=timeout, cwd=cwd)
+                else:
+                    # Create temporary file
+                    with tempfile.NamedTemporaryFile(
+                        mode='w', 
+                        suffix='.py', 
+                        delete=False
+                    ) as f:
+                        f.write(code)
+                        temp_file = f.name
+                    
+                    try:
+                        async with self._get_execution_semaphore():
+                            result = await run_subprocess(
+                                [sys.executable, temp_file],
+                                timeout=timeout,
+                                cwd=cwd,
+                                on_output=self._log_output
+                            )
+                    finally:
+                        os.unlink(temp_file)
                 
-                # Clean up
-                import os
-                os.unlink(temp_file)
+                if result.timed_out:
+                    return {
+                        "status": "error",
+                        "error": f"Execution timeout after {timeout}s",
+                        "stdout": result.stdout,
+                        "stderr": result.stderr
+                    }
                 
                 return {
                     "status": "success",
@@ -207,11 +300,6 @@ class MCPClient:
                     "returncode": result.returncode
                 }
                 
-            except subprocess.TimeoutExpired:
-                return {
-                    "status": "error",
-                    "error": f"Execution timeout after {timeout}s"
-                }
             except Exception as e:
                 logger.error(f"Code execution error: {e}")
                 return {
@@ -221,16 +309,23 @@ class MCPClient:
         
         elif tool_name == "install_package":
             package = arguments.get("package", "")
+            timeout = arguments.get("timeout", 60)
             
             try:
-                import subprocess
+                async with self._get_execution_semaphore():
+                    result = await run_subprocess(
+                        [sys.executable, "-m", "pip", "install", package],
+                        timeout=timeout,
+                        on_output=self._log_output
+                    )
                 
-                result = subprocess.run(
-                    ["pip3", "install", package],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
+                if result.timed_out:
+                    return {
+                        "status": "error",
+                        "error": f"Installation timeout after {timeout}s",
+                        "stdout": result.stdout,
+                        "stderr": result.stderr
+                    }
                 
                 return {
                     "status": "success" if result.returncode == 0 else "error",
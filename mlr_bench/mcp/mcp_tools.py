@@ -1,8 +1,9 @@
 """MCP-based tools for agents."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from loguru import logger
 
+from mlr_bench.config.config import Config
 from mlr_bench.mcp.mcp_client import MCPClient
 
 
@@ -19,6 +20,7 @@ async def get_mcp_client() -> MCPClient:
     global _mcp_client
     
     if _mcp_client is None:
+        config = Config()
         _mcp_client = MCPClient()
         
         # Connect to default servers
@@ -29,7 +31,18 @@ async def get_mcp_client() -> MCPClient:
         
         await _mcp_client.connect_server(
             "python_executor",
-            {"type": "local", "sandbox": True}
+            {
+                "type": "local",
+                "sandbox": True,
+                "max_concurrency": config.max_concurrent_executions,
+                "worker_pool": config.executor_worker_pool,
+                "preload_modules": [
+                    m.strip() for m in config.executor_preload_modules.split(",")
+                    if m.strip()
+                ],
+                "worker_max_runs": config.executor_worker_max_runs,
+                "worker_max_memory_mb": config.executor_worker_max_memory_mb
+            }
         )
         
         logger.info("MCP client initialized with default servers")
@@ -80,22 +93,31 @@ async def search_papers_mcp(query: str, limit: int = 10) -> dict:
     return result
 
 
-async def execute_python_code_mcp(code: str, timeout: int = 30) -> dict:
+async def execute_python_code_mcp(
+    code: str,
+    timeout: int = 30,
+    workspace: Optional[str] = None
+) -> dict:
     """Execute Python code in sandbox via MCP.
     
     Args:
         code: Python code to execute
         timeout: Execution timeout in seconds
+        workspace: Task workspace used as the working directory
         
     Returns:
         Execution result
     """
     client = await get_mcp_client()
     
+    arguments = {"code": code, "timeout": timeout}
+    if workspace:
+        arguments["workspace"] = workspace
+    
     result = await client.call_tool(
         "python_executor",
         "execute_code",
-        {"code": code, "timeout": timeout}
+        arguments
     )
     
     if result.get("status") == "success":
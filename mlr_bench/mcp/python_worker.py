@@ -0,0 +1,193 @@
+"""Warm Python worker process for the python_executor pool.
+
+The worker preloads a configurable set of modules once, then executes
+scripts sent by the parent one at a time. Requests arrive as JSON lines
+on a private duplicate of stdin; replies are JSON lines written to a
+private duplicate of stdout. While a script runs, file descriptors 1
+and 2 are redirected to capture files chosen by the parent, so output
+from C extensions and child processes is captured too.
+
+This file is run directly as a script and must only use the standard
+library.
+"""
+
+import os
+import sys
+import json
+import time
+import builtins
+import importlib
+import traceback
+
+
+def _rss_mb() -> float:
+    """Get the current resident set size in megabytes."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+        divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+        return peak / divisor
+    except ImportError:
+        return 0.0
+
+
+def _preload(modules):
+    """Import modules so scripts don't pay for them.
+
+    Args:
+        modules: Module names
+
+    Returns:
+        Tuple of (loaded module names, failure messages)
+    """
+    loaded, failed = [], []
+    for name in modules:
+        try:
+            importlib.import_module(name)
+            loaded.append(name)
+        except Exception as e:
+            failed.append(f"{name}: {e}")
+    return loaded, failed
+
+
+def _drop_local_modules(cwd):
+    """Forget modules imported from the script's directory.
+
+    Scripts are regenerated between runs, so modules such as a
+    workspace ``model.py`` must be re-imported fresh every time.
+
+    Args:
+        cwd: Script working directory
+    """
+    prefix = os.path.join(os.path.realpath(cwd), "")
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and os.path.realpath(path).startswith(prefix):
+            del sys.modules[name]
+
+
+def _run(request):
+    """Execute one script with fresh globals.
+
+    Args:
+        request: Request with script_path, cwd, stdout_path, stderr_path
+
+    Returns:
+        Reply dictionary
+    """
+    script_path = request["script_path"]
+    cwd = request.get("cwd") or os.path.dirname(script_path)
+
+    saved_cwd = os.getcwd()
+    saved_path = list(sys.path)
+    saved_argv = list(sys.argv)
+    saved_fds = (os.dup(1), os.dup(2))
+
+    started = time.perf_counter()
+    returncode = 0
+
+    with open(request["stdout_path"], "wb") as out, \
+            open(request["stderr_path"], "wb") as err:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+
+        try:
+            os.chdir(cwd)
+            sys.argv = [script_path]
+            sys.path.insert(0, cwd)
+
+            with open(script_path, encoding="utf-8") as f:
+                source = f.read()
+
+            script_globals = {
+                "__name__": "__main__",
+                "__file__": script_path,
+                "__builtins__": builtins,
+            }
+            exec(compile(source, script_path, "exec"), script_globals)
+        except SystemExit as e:
+            if e.code is None:
+                returncode = 0
+            elif isinstance(e.code, int):
+                returncode = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+        except BaseException:
+            # Hide this module's frame from the script's traceback
+            exc_type, exc, tb = sys.exc_info()
+            traceback.print_exception(exc_type, exc, tb.tb_next)
+            returncode = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved_fds[0], 1)
+            os.dup2(saved_fds[1], 2)
+            os.close(saved_fds[0])
+            os.close(saved_fds[1])
+            os.chdir(saved_cwd)
+            sys.path[:] = saved_path
+            sys.argv = saved_argv
+            _drop_local_modules(cwd)
+
+    return {
+        "id": request.get("id"),
+        "returncode": returncode,
+        "duration": time.perf_counter() - started,
+        "rss_mb": _rss_mb(),
+    }
+
+
+def main():
+    """Worker main loop."""
+    # Don't let this directory shadow user imports
+    here = os.path.dirname(os.path.abspath(__file__))
+    sys.path[:] = [p for p in sys.path if os.path.abspath(p or ".") != here]
+
+    # Keep private channels to the parent; scripts get an empty stdin
+    # and fds 1/2 are silenced between runs
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    protocol = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull_in = os.open(os.devnull, os.O_RDONLY)
+    devnull_out = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull_in, 0)
+    os.dup2(devnull_out, 1)
+    os.dup2(devnull_out, 2)
+    os.close(devnull_in)
+    os.close(devnull_out)
+
+    modules = [
+        m.strip() for m in os.environ.get("MLR_WORKER_PRELOAD", "").split(",")
+        if m.strip()
+    ]
+    loaded, failed = _preload(modules)
+
+    protocol.write(json.dumps({
+        "ready": True,
+        "pid": os.getpid(),
+        "preloaded": loaded,
+        "preload_errors": failed,
+        "rss_mb": _rss_mb(),
+    }) + "\n")
+    protocol.flush()
+
+    for line in requests:
+        if not line.strip():
+            continue
+        reply = _run(json.loads(line))
+        protocol.write(json.dumps(reply) + "\n")
+        protocol.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Non-blocking subprocess execution for local MCP servers."""
+
+import os
+import signal
+import asyncio
+import codecs
+import platform
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from loguru import logger
+
+
+# Bytes read from a pipe per chunk
+READ_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class ProcessResult:
+    """Outcome of a subprocess run."""
+
+    stdout: str
+    stderr: str
+    returncode: Optional[int]
+    timed_out: bool = False
+    duration: float = 0.0
+
+
+OutputCallback = Callable[[str, str], None]
+
+
+async def _pump_stream(
+    stream: asyncio.StreamReader,
+    name: str,
+    chunks: List[str],
+    on_output: Optional[OutputCallback]
+) -> None:
+    """Read a pipe incrementally until EOF.
+
+    Args:
+        stream: Pipe to read from
+        name: Stream name ("stdout" or "stderr")
+        chunks: List collecting decoded chunks
+        on_output: Optional callback receiving (name, text) per chunk
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    while True:
+        data = await stream.read(READ_CHUNK_SIZE)
+        text = decoder.decode(data, final=not data)
+        if text:
+            chunks.append(text)
+            if on_output:
+                try:
+                    on_output(name, text)
+                except Exception as e:
+                    logger.error(f"Error in output callback: {e}")
+        if not data:
+            break
+
+
+def kill_process_tree(process: asyncio.subprocess.Process) -> None:
+    """Kill a process and every process in its group.
+
+    Args:
+        process: Process started in its own session
+    """
+    if process.returncode is not None:
+        return
+
+    try:
+        if platform.system() != "Windows":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def run_subprocess(
+    cmd: List[str],
+    timeout: float,
+    cwd: Optional[Path] = None,
+    env: Optional[Dict[str, str]] = None,
+    on_output: Optional[OutputCallback] = None
+) -> ProcessResult:
+    """Run a command without blocking the event loop.
+
+    Output is streamed from both pipes as it is produced. The process is
+    started in its own process group so that a timeout kills any children
+    it spawned as well.
+
+    Args:
+        cmd: Command and arguments
+        timeout: Wall-clock timeout in seconds
+        cwd: Working directory
+        env: Environment variables (inherits the current ones if None)
+        on_output: Optional callback receiving (stream_name, text) chunks
+
+    Returns:
+        Process result
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    kwargs = {}
+    if platform.system() != "Windows":
+        kwargs["start_new_session"] = True
+
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        stdin=asyncio.subprocess.DEVNULL,
+        cwd=str(cwd) if cwd else None,
+        env=env,
+        **kwargs
+    )
+
+    stdout_chunks: List[str] = []
+    stderr_chunks: List[str] = []
+    readers = asyncio.gather(
+        _pump_stream(process.stdout, "stdout", stdout_chunks, on_output),
+        _pump_stream(process.stderr, "stderr", stderr_chunks, on_output),
+        process.wait()
+    )
+
+    timed_out = False
+    try:
+        await asyncio.wait_for(readers, timeout=timeout)
+    except asyncio.TimeoutError:
+        timed_out = True
+        logger.warning(f"Process {process.pid} timed out after {timeout}s, killing")
+        kill_process_tree(process)
+        await process.wait()
+    except asyncio.CancelledError:
+        kill_process_tree(process)
+        raise
+
+    return ProcessResult(
+        stdout="".join(stdout_chunks),
+        stderr="".join(stderr_chunks),
+        returncode=process.returncode,
+        timed_out=timed_out,
+        duration=loop.time() - started
+    )
@@ -0,0 +1,335 @@
+"""Pool of warm Python worker processes for the python_executor."""
+
+import os
+import sys
+import json
+import uuid
+import signal
+import shutil
+import asyncio
+import platform
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+from loguru import logger
+
+from mlr_bench.mcp.subprocess_runner import ProcessResult, kill_process_tree
+
+
+WORKER_SCRIPT = Path(__file__).parent / "python_worker.py"
+
+
+class _Worker:
+    """Handle on one warm worker process."""
+
+    def __init__(self, process: asyncio.subprocess.Process, scratch_dir: Path):
+        """Initialize worker handle.
+
+        Args:
+            process: Worker process
+            scratch_dir: Private directory for scripts and capture files
+        """
+        self.process = process
+        self.scratch_dir = scratch_dir
+        self.runs = 0
+        self.baseline_rss_mb = 0.0
+        self.rss_mb = 0.0
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker process is still running."""
+        return self.process.returncode is None
+
+    def kill(self) -> None:
+        """Kill the worker and anything it spawned."""
+        kill_process_tree(self.process)
+        shutil.rmtree(self.scratch_dir, ignore_errors=True)
+
+
+class PythonWorkerPool:
+    """Pre-forked pool of Python interpreters with preloaded modules.
+
+    Each execution gets fresh globals and its own working directory in a
+    long-lived interpreter, so snippets skip interpreter startup and the
+    import cost of heavy libraries. Workers are recycled after a number
+    of runs or when their memory grows too much, and are killed outright
+    when an execution exceeds its timeout.
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        preload_modules: Optional[List[str]] = None,
+        max_runs_per_worker: int = 50,
+        max_memory_growth_mb: float = 1024.0,
+        startup_timeout: float = 120.0
+    ):
+        """Initialize worker pool.
+
+        Args:
+            size: Number of worker processes
+            preload_modules: Modules imported by every worker at startup
+            max_runs_per_worker: Executions before a worker is recycled
+            max_memory_growth_mb: RSS growth over baseline that triggers recycling
+            startup_timeout: Seconds to wait for a worker to become ready
+        """
+        self.size = max(1, size)
+        self.preload_modules = preload_modules or []
+        self.max_runs_per_worker = max_runs_per_worker
+        self.max_memory_growth_mb = max_memory_growth_mb
+        self.startup_timeout = startup_timeout
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._idle: Optional[asyncio.Queue] = None
+        self._workers: List[_Worker] = []
+        self._started = False
+
+    async def start(self) -> None:
+        """Spawn all workers."""
+        if self._started:
+            return
+
+        self.loop = asyncio.get_running_loop()
+        self._idle = asyncio.Queue()
+        self._started = True
+
+        results = await asyncio.gather(
+            *[self._spawn() for _ in range(self.size)],
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Failed to start Python worker: {result}")
+                # Retry lazily on the next acquire
+                self._idle.put_nowait(None)
+            else:
+                self._idle.put_nowait(result)
+
+        logger.info(
+            f"Python worker pool started with {self.size} workers "
+            f"(preload: {', '.join(self.preload_modules) or 'none'})"
+        )
+
+    async def _spawn(self) -> _Worker:
+        """Start a worker and wait until it has finished preloading.
+
+        Returns:
+            Ready worker
+        """
+        env = dict(os.environ)
+        env["MLR_WORKER_PRELOAD"] = ",".join(self.preload_modules)
+
+        kwargs = {}
+        if platform.system() != "Windows":
+            kwargs["start_new_session"] = True
+
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-u", str(WORKER_SCRIPT),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=env,
+            **kwargs
+        )
+        worker = _Worker(process, Path(tempfile.mkdtemp(prefix="mlr_worker_")))
+
+        try:
+            line = await asyncio.wait_for(
+                process.stdout.readline(), timeout=self.startup_timeout
+            )
+            ready = json.loads(line) if line else {}
+            if not ready.get("ready"):
+                raise RuntimeError("worker exited during startup")
+        except BaseException:
+            worker.kill()
+            raise
+
+        for error in ready.get("preload_errors", []):
+            logger.warning(f"Worker could not preload {error}")
+
+        worker.baseline_rss_mb = worker.rss_mb = ready.get("rss_mb", 0.0)
+        self._workers.append(worker)
+        logger.debug(f"Python worker {process.pid} ready ({worker.rss_mb:.0f} MB)")
+        return worker
+
+    async def _acquire(self) -> _Worker:
+        """Take an idle worker, replacing it if it is missing or dead.
+
+        Returns:
+            Ready worker
+        """
+        worker = await self._idle.get()
+        if worker is not None and worker.alive:
+            return worker
+
+        if worker is not None:
+            self._discard(worker)
+
+        try:
+            return await self._spawn()
+        except BaseException:
+            self._idle.put_nowait(None)
+            raise
+
+    def _release(self, worker: _Worker) -> None:
+        """Return a worker to the pool, recycling it if needed.
+
+        Args:
+            worker: Worker that finished an execution
+        """
+        growth = worker.rss_mb - worker.baseline_rss_mb
+        if worker.runs >= self.max_runs_per_worker or growth > self.max_memory_growth_mb:
+            logger.debug(
+                f"Recycling Python worker {worker.process.pid} "
+                f"after {worker.runs} runs (+{growth:.0f} MB)"
+            )
+            self._discard(worker)
+            asyncio.create_task(self._replace())
+        else:
+            self._idle.put_nowait(worker)
+
+    async def _replace(self) -> None:
+        """Spawn a replacement worker in the background."""
+        try:
+            self._idle.put_nowait(await self._spawn())
+        except Exception as e:
+            logger.error(f"Failed to replace Python worker: {e}")
+            self._idle.put_nowait(None)
+
+    def _discard(self, worker: _Worker) -> None:
+        """Kill a worker and forget about it.
+
+        Args:
+            worker: Worker to discard
+        """
+        worker.kill()
+        if worker in self._workers:
+            self._workers.remove(worker)
+
+    async def execute(
+        self,
+        code: str,
+        timeout: float,
+        cwd: Optional[Path] = None
+    ) -> ProcessResult:
+        """Execute code in a warm worker.
+
+        Args:
+            code: Python source code
+            timeout: Hard wall-clock timeout in seconds
+            cwd: Working directory (a fresh temporary directory if None)
+
+        Returns:
+            Process result
+        """
+        if not self._started:
+            await self.start()
+
+        worker = await self._acquire()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        run_id = uuid.uuid4().hex[:8]
+        script_path = worker.scratch_dir / f"run_{run_id}.py"
+        stdout_path = worker.scratch_dir / f"run_{run_id}.out"
+        stderr_path = worker.scratch_dir / f"run_{run_id}.err"
+        temp_cwd = None
+        if cwd is None:
+            temp_cwd = Path(tempfile.mkdtemp(prefix="mlr_run_"))
+            cwd = temp_cwd
+
+        script_path.write_text(code, encoding="utf-8")
+        request = {
+            "id": run_id,
+            "script_path": str(script_path),
+            "cwd": str(Path(cwd).resolve()),
+            "stdout_path": str(stdout_path),
+            "stderr_path": str(stderr_path),
+        }
+
+        timed_out = False
+        returncode: Optional[int] = None
+        try:
+            worker.process.stdin.write((json.dumps(request) + "\n").encode("utf-8"))
+            await worker.process.stdin.drain()
+            line = await asyncio.wait_for(worker.process.stdout.readline(), timeout=timeout)
+            if not line:
+                raise RuntimeError("worker exited during execution")
+
+            reply = json.loads(line)
+            returncode = reply.get("returncode")
+            worker.runs += 1
+            worker.rss_mb = reply.get("rss_mb", worker.rss_mb)
+        except asyncio.TimeoutError:
+            timed_out = True
+            logger.warning(f"Execution timed out after {timeout}s, killing worker {worker.process.pid}")
+        except BaseException:
+            # Worker state is unknown; replace it
+            self._discard(worker)
+            if temp_cwd is not None:
+                shutil.rmtree(temp_cwd, ignore_errors=True)
+            self._idle.put_nowait(None)
+            raise
+
+        stdout, stderr = self._read_capture(stdout_path, stderr_path)
+        for path in (script_path, stdout_path, stderr_path):
+            path.unlink(missing_ok=True)
+        if temp_cwd is not None:
+            shutil.rmtree(temp_cwd, ignore_errors=True)
+
+        if timed_out:
+            self._discard(worker)
+            asyncio.create_task(self._replace())
+        else:
+            self._release(worker)
+
+        return ProcessResult(
+            stdout=stdout,
+            stderr=stderr,
+            returncode=returncode,
+            timed_out=timed_out,
+            duration=loop.time() - started
+        )
+
+    @staticmethod
+    def _read_capture(stdout_path: Path, stderr_path: Path):
+        """Read captured output files.
+
+        Args:
+            stdout_path: Captured stdout file
+            stderr_path: Captured stderr file
+
+        Returns:
+            Tuple of (stdout, stderr)
+        """
+        def read(path: Path) -> str:
+            try:
+                return path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                return ""
+
+        return read(stdout_path), read(stderr_path)
+
+    async def shutdown(self) -> None:
+        """Stop all workers."""
+        for worker in list(self._workers):
+            self._discard(worker)
+        self._started = False
+        logger.info("Python worker pool shut down")
+
+    def abandon(self) -> None:
+        """Kill all workers without touching the event loop.
+
+        Used when the loop that owns the pool is gone.
+        """
+        for worker in list(self._workers):
+            try:
+                if platform.system() != "Windows":
+                    os.killpg(worker.process.pid, signal.SIGKILL)
+                else:
+                    os.kill(worker.process.pid, signal.SIGTERM)
+            except (ProcessLookupError, PermissionError, OSError):
+                pass
+            shutil.rmtree(worker.scratch_dir, ignore_errors=True)
+        self._workers.clear()
+        self._started = False
@@ -0,0 +1,113 @@
+"""Unit tests for the MCP client python executor."""
+
+import time
+import asyncio
+import pytest
+
+from mlr_bench.mcp.mcp_client import MCPClient
+
+
+async def _make_client(max_concurrency: int = 4, worker_pool: bool = False) -> MCPClient:
+    """Create a client connected to the local python executor."""
+    client = MCPClient()
+    await client.connect_server(
+        "python_executor",
+        {
+            "type": "local",
+            "sandbox": True,
+            "max_concurrency": max_concurrency,
+            "worker_pool": worker_pool
+        }
+    )
+    return client
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("worker_pool", [False, True])
+async def test_execute_code_success(worker_pool):
+    """Test executing a simple snippet."""
+    client = await _make_client(worker_pool=worker_pool)
+
+    result = await client.call_tool(
+        "python_executor", "execute_code", {"code": "print('hello')"}
+    )
+
+    assert result["status"] == "success"
+    assert result["stdout"].strip() == "hello"
+    assert result["returncode"] == 0
+    await client.disconnect_server("python_executor")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("worker_pool", [False, True])
+async def test_execute_code_timeout_does_not_block_loop(worker_pool):
+    """Test that a timed out execution is killed without stalling the loop."""
+    client = await _make_client(worker_pool=worker_pool)
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.05)
+
+    started = time.monotonic()
+    result, _ = await asyncio.gather(
+        client.call_tool(
+            "python_executor",
+            "execute_code",
+            {"code": "import time\nprint('begin', flush=True)\ntime.sleep(30)", "timeout": 1}
+        ),
+        ticker()
+    )
+
+    assert result["status"] == "error"
+    assert "timeout" in result["error"]
+    assert "begin" in result["stdout"]
+    assert time.monotonic() - started < 10
+    assert len(ticks) == 5
+    await client.disconnect_server("python_executor")
+
+
+@pytest.mark.asyncio
+async def test_execute_code_concurrency_limit():
+    """Test that the semaphore caps simultaneous executions."""
+    client = await _make_client(max_concurrency=1)
+    code = "import time\ntime.sleep(0.5)"
+
+    started = time.monotonic()
+    results = await asyncio.gather(*[
+        client.call_tool("python_executor", "execute_code", {"code": code})
+        for _ in range(2)
+    ])
+
+    assert all(r["status"] == "success" for r in results)
+    assert time.monotonic() - started >= 1.0
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_isolates_executions(tmp_path):
+    """Test that warm workers give each run fresh globals and its own cwd."""
+    client = await _make_client(max_concurrency=1, worker_pool=True)
+    (tmp_path / "helper.py").write_text("VALUE = 1\n")
+
+    first = await client.call_tool(
+        "python_executor",
+        "execute_code",
+        {
+            "code": "import os, helper\nleaked = True\nprint(os.getcwd(), helper.VALUE)",
+            "workspace": str(tmp_path)
+        }
+    )
+    (tmp_path / "helper.py").write_text("VALUE = 2\n")
+    second = await client.call_tool(
+        "python_executor",
+        "execute_code",
+        {
+            "code": "import helper\nprint('leaked' in globals(), helper.VALUE)",
+            "workspace": str(tmp_path)
+        }
+    )
+
+    assert first["stdout"].split() == [str(tmp_path.resolve()), "1"]
+    assert second["stdout"].split() == ["False", "2"]
+    await client.disconnect_server("python_executor")